@@ -30,6 +30,7 @@ def parse_mud_config(file_path: str):
 
 class BaseTable:
     RESERVED_SQL_KEYWORDS = {"exists", "from", "values", "limit", "index"}
+    FILTER_OPERATORS = {"lt": "<", "lte": "<=", "gt": ">", "gte": ">=", "ne": "!="}
 
     def __init__(self, sdk, table_name, schema, keys):
         self.sdk = sdk
@@ -41,53 +42,78 @@ class BaseTable:
         """Escape column names that are reserved SQL keywords."""
         return f'"{column_name}"' if column_name in self.RESERVED_SQL_KEYWORDS else column_name
 
-    def get(self, limit=1000, **filters):
+    def _filter_condition(self, key, value):
+        """Build a WHERE condition, honouring Django-style suffixes such as `placementTime__lte`."""
+        column, _, suffix = key.rpartition("__")
+        if column and suffix in self.FILTER_OPERATORS:
+            return f"{self._escape_column_name(column)}{self.FILTER_OPERATORS[suffix]}{repr(value)}"
+        return f"{self._escape_column_name(key)}={repr(value)}"
+
+    def get(self, limit=1000, columns=None, **filters):
         """
         Query the table with optional filters.
 
         Args:
             limit (int): Maximum number of rows to retrieve. Default is 1000.
-            **filters: Key-value pairs to filter the query.
+            columns (List[str], optional): Only select these columns. Defaults to the full schema.
+            **filters: Key-value pairs to filter the query. Suffix a column with `__lt`, `__lte`,
+                `__gt`, `__gte` or `__ne` to compare instead of matching exactly.
 
         Returns:
             List[Dict[str, Any]]: A list of records from the table.
         """
-        select_columns = ", ".join(self.schema.keys())
-        where_clause = " AND ".join(
-            f"{self._escape_column_name(key)}={repr(value)}" for key, value in filters.items()
-        )
+        response = self._query(limit, columns, filters)
+        return self._parse_response(response)
+
+    def _build_query(self, limit, columns, filters):
+        select_columns = ", ".join(self._escape_column_name(col) for col in (columns or self.schema.keys()))
+        where_clause = " AND ".join(self._filter_condition(key, value) for key, value in filters.items())
         query = f"SELECT {select_columns} FROM {self.table_name}"
         if where_clause:
             query += f" WHERE {where_clause}"
         query += f" LIMIT {limit};"
+        return query
 
-        payload = [{"address": self.sdk.world_address, "query": query}]
-        response = self.sdk.post(payload)
-        return self._parse_response(response)
+    def _query(self, limit, columns, filters):
+        payload = [{"address": self.sdk.world_address, "query": self._build_query(limit, columns, filters)}]
+        return self.sdk.post(payload)
 
-    def _parse_response(self, response):
+    def _parse_results(self, response):
+        """Return the raw result table (header row first), or None if it is empty."""
         if "result" not in response or not response["result"]:
             return None  # Return None if there are no results
         results = response["result"][0]
         if not results:  # Check if the results array is empty
             return None
+        return results
+
+    def _parse_response(self, response):
+        results = self._parse_results(response)
+        if results is None:
+            return None
         headers, *rows = results
         return [dict(zip(headers, row)) for row in rows]
 
     
-    def to_dataframe(self, limit=MAX_LIMIT, **filters):
+    def to_dataframe(self, limit=MAX_LIMIT, columns=None, **filters):
         """
         Downloads the table and converts it to a Pandas DataFrame.
 
         Args:
             limit (int): Maximum number of rows to retrieve. Default is MAX_LIMIT.
-            **filters: Key-value pairs to filter the query.
+            columns (List[str], optional): Only select these columns. Defaults to the full schema.
+            **filters: Key-value pairs to filter the query. Suffix a column with `__lt`, `__lte`,
+                `__gt`, `__gte` or `__ne` to compare instead of matching exactly.
 
         Returns:
             pd.DataFrame: A DataFrame containing the table data.
         """
-        rows = self.get(limit=limit, **filters)
-        return pd.DataFrame(rows)
+        # Build the frame straight from the indexer's row lists rather than going through a dict per row
+        results = self._parse_results(self._query(limit, columns, filters))
+        if results is None:
+            return pd.DataFrame()
+        headers, *rows = results
+        return pd.DataFrame.from_records(rows, columns=headers)
 
 class TableRegistry:
     def __init__(self, sdk):
@@ -112,31 +138,7 @@ class TableRegistry:
             {k: self.SOLIDITY_TO_PYTHON_TYPE.get(v, Any) for k, v in schema.items()}
         )
 
-        def get(self, limit=1000, **filters):
-            """
-            Query the table with optional filters.
-
-            Args:
-                limit (int): Maximum number of rows to retrieve. Default is 1000.
-                **filters: Key-value pairs to filter the query.
-
-            Returns:
-                List[Dict[str, Any]]: A list of records from the table.
-            """
-            select_columns = ", ".join(self._escape_column_name(col) for col in self.schema.keys())
-            where_clause = " AND ".join(
-                f"{self._escape_column_name(key)}={repr(value)}" for key, value in filters.items()
-            )
-            query = f"SELECT {select_columns} FROM {self.table_name}"
-            if where_clause:
-                query += f" WHERE {where_clause}"
-            query += f" LIMIT {limit};"
-
-            payload = [{"address": self.sdk.world_address, "query": query}]
-            response = self.sdk.post(payload)
-            return self._parse_response(response)
-
-        table_class = type(table_name, (BaseTable,), {"get": get})
+        table_class = type(table_name, (BaseTable,), {})
         table_instance = table_class(self.sdk, table_name, schema, keys)
         setattr(self, table_name, table_instance)
 
@@ -192,12 +194,11 @@ class MUDIndexerSDK:
             try:
                 logging.info(f"Downloading table: {table_name}")
 
-                # Fetch all rows in a single call
-                rows = self.tables.__getattribute__(table_name).get(limit=9999999)
+                # Fetch all rows in a single call, straight into a DataFrame
+                table_df = self.tables.__getattribute__(table_name).to_dataframe(limit=MAX_LIMIT)
 
-                if rows:
-                    # Convert rows to a DataFrame and store in the dictionary
-                    table_dataframes[table_name] = pd.DataFrame(rows)
+                if not table_df.empty:
+                    table_dataframes[table_name] = table_df
                 else:
                     logging.warning(f"No data found for table {table_name}.")
                     table_dataframes[table_name] = pd.DataFrame()  # Empty DataFrame for consistency
@@ -1,42 +1,270 @@
 from web3 import Web3
+from eth_utils import keccak
+import requests
+from requests.adapters import HTTPAdapter
+import functools
+import hashlib
 import json
+import os
+import re
+import sys
+import threading
+import warnings
 from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from contextvars import ContextVar
+try:
+    import orjson  # Optional: much faster parsing of large ABI/artifact files
+except ImportError:
+    orjson = None
+try:
+    import ijson  # Optional: without orjson, stream the ABI out of large artifacts and skip their bytecode
+except ImportError:
+    ijson = None
 from .MUDIndexerSDK import MUDIndexerSDK
 
+RPC_POOL_SIZE = 64
+STREAM_PARSE_MIN_BYTES = 512 * 1024
+# Bump whenever the parsing rules change, so caches written by older versions are ignored
+ABI_CACHE_VERSION = 1
+ERROR_HEX_RE = re.compile(r'0x[a-fA-F0-9]+')
+
+_CHAIN_ID_CACHE = {}
+_RPC_SESSIONS = {}
+_RPC_SESSIONS_LOCK = threading.Lock()
+
+# [world, batch, queued_call_count] for the World.batch() block active in the current thread/async context
+_ACTIVE_BATCH = ContextVar("mudpy_active_batch", default=None)
+
+# JSON files commonly found next to contract artifacts that never contain an ABI
+NON_ABI_DIRS = {"node_modules", ".git", "cache"}
+NON_ABI_FILES = {"package.json", "package-lock.json", "tsconfig.json"}
+
+def _rpc_session(rpc):
+    """
+    One pooled session per RPC endpoint, shared by every World using it, so concurrent calls
+    reuse connections instead of queueing on sockets and no pool is left open per World.
+    """
+    with _RPC_SESSIONS_LOCK:
+        session = _RPC_SESSIONS.get(rpc)
+        if session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=RPC_POOL_SIZE, pool_maxsize=RPC_POOL_SIZE)
+            session.mount("http://", adapter)
+            session.mount("https://", adapter)
+            _RPC_SESSIONS[rpc] = session
+        return session
+
+def _is_abi_candidate(root_path, path):
+    if path.name in NON_ABI_FILES or path.name.startswith("tsconfig"):
+        return False
+    return not any(part in NON_ABI_DIRS for part in path.relative_to(root_path).parts[:-1])
+
 def find_abi_files(root_dir):
-    """Recursively find all ABI files"""
-    abi_files = []
+    """Recursively find all ABI files, skipping package manifests and dependency folders"""
     root_path = Path(root_dir)
-    abi_patterns = ["*.abi.json", "*.json"]
-    for pattern in abi_patterns:
-        abi_files.extend(root_path.rglob(pattern))
-    return abi_files
+    # "*.json" already matches "*.abi.json", so a single walk finds every file exactly once
+    return [path for path in root_path.rglob("*.json") if _is_abi_candidate(root_path, path)]
 
-def load_abis(root_dir) -> dict:
-    """Load all ABI files from directory structure"""
-    abis = {}
-    for abi_file in find_abi_files(root_dir):
-        try:
+def _stream_parse_json(f):
+    """
+    Parse a JSON document in a single streaming pass, stopping as soon as a top-level "abi" array
+    is complete so the bytecode that usually follows it in build artifacts is never read.
+    """
+    builder = ijson.ObjectBuilder()
+    for prefix, event, value in ijson.parse(f, use_float=True):
+        builder.event(event, value)
+        if prefix == 'abi' and event == 'end_array':
+            return {'abi': builder.value['abi']}
+    return builder.value
+
+def _load_abi_file(abi_file) -> list:
+    """Parse a single ABI file into a list of (contract_name, abi) pairs, or None if it cannot be read"""
+    contract_name = abi_file.parent.name if abi_file.name == 'abi.json' else abi_file.stem.replace('.abi', '')
+    try:
+        if orjson is not None:
+            with open(abi_file, 'rb') as f:
+                abi_data = orjson.loads(f.read())
+        elif ijson is not None and abi_file.stat().st_size > STREAM_PARSE_MIN_BYTES:
+            with open(abi_file, 'rb') as f:
+                # Only artifact objects carry bytecode worth skipping; plain ABI arrays parse faster with json
+                is_object = f.read(64).lstrip().startswith(b'{')
+                f.seek(0)
+                abi_data = _stream_parse_json(f) if is_object else json.loads(f.read())
+        else:
             with open(abi_file, 'r') as f:
                 abi_data = json.load(f)
-                
-            if isinstance(abi_data, dict):
-                if 'abi' in abi_data:
-                    abi_data = abi_data['abi']
-                elif 'contracts' in abi_data:
-                    for contract_name, contract_data in abi_data['contracts'].items():
-                        if 'abi' in contract_data:
-                            abis[contract_name] = contract_data['abi']
-                    continue
-                
-            contract_name = abi_file.parent.name if abi_file.name == 'abi.json' else abi_file.stem.replace('.abi', '')
-            abis[contract_name] = abi_data
-                
-        except Exception as e:
+
+        if isinstance(abi_data, dict):
+            if 'abi' in abi_data:
+                abi_data = abi_data['abi']
+            elif 'contracts' in abi_data:
+                return [
+                    (contract_name, contract_data['abi'])
+                    for contract_name, contract_data in abi_data['contracts'].items()
+                    if 'abi' in contract_data
+                ]
+
+        return [(contract_name, abi_data)]
+
+    except Exception as e:
+        print(f"Error processing {abi_file}: {e}")
+        return None
+
+def _abi_files_signature(abi_files) -> tuple:
+    """Identify a set of ABI files by path, modification time and size"""
+    signature = []
+    for abi_file in abi_files:
+        try:
+            stat = abi_file.stat()
+        except OSError as e:  # Dangling symlink or file removed since the directory walk
             print(f"Error processing {abi_file}: {e}")
-    
+            continue
+        signature.append((str(abi_file), stat.st_mtime_ns, stat.st_size))
+    return tuple(signature)
+
+def _abi_cache_dir() -> Path:
+    """Per-user ABI cache directory, private to the current user"""
+    cache_root = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    cache_dir = Path(cache_root) / "mudpy"
+    cache_dir.mkdir(mode=0o700, parents=True, exist_ok=True)
+    return cache_dir
+
+def _abi_cache_prefix(root_dir) -> str:
+    return "abis_" + hashlib.blake2b(str(Path(root_dir).resolve()).encode(), digest_size=8).hexdigest()
+
+def _abi_cache_path(root_dir, signature) -> Path:
+    # Key on resolved paths too, so retargeted symlinks invalidate the cache
+    resolved = tuple((path, str(Path(path).resolve()), mtime, size) for path, mtime, size in signature)
+    key = hashlib.blake2b(repr((ABI_CACHE_VERSION, resolved)).encode(), digest_size=16).hexdigest()
+    return _abi_cache_dir() / f"{_abi_cache_prefix(root_dir)}_{key}.json"
+
+def _read_abi_cache(cache_path):
+    with open(cache_path, 'rb') as f:
+        data = f.read()
+    abis = orjson.loads(data) if orjson is not None else json.loads(data)
+    return abis if isinstance(abis, dict) else None
+
+def _write_abi_cache(root_dir, cache_path, abis):
+    """Write the cache readable only by the current user and drop stale entries for the same directory"""
+    data = orjson.dumps(abis) if orjson is not None else json.dumps(abis).encode()
+    tmp_path = cache_path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+    fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+    with os.fdopen(fd, 'wb') as f:
+        f.write(data)
+    os.replace(tmp_path, cache_path)
+
+    for stale in cache_path.parent.glob(f"{_abi_cache_prefix(root_dir)}_*.json"):
+        if stale != cache_path:
+            stale.unlink(missing_ok=True)
+
+def load_abis(root_dir, signature=None) -> dict:
+    """
+    Load all ABI files from directory structure, reusing the on-disk cache when nothing changed.
+
+    Args:
+        root_dir (str): Directory containing ABI files.
+        signature (tuple, optional): Precomputed `_abi_files_signature` of the directory, so the
+            files are not walked and stat'ed a second time.
+    """
+    abis = {}
+    if signature is None:
+        signature = _abi_files_signature(find_abi_files(root_dir))
+    abi_files = [Path(path) for path, _, _ in signature]
+    if not abi_files:
+        return abis
+
+    try:
+        cache_path = _abi_cache_path(root_dir, signature)
+    except OSError:
+        cache_path = None  # No usable cache directory, parse without caching
+
+    if cache_path is not None:
+        try:
+            cached = _read_abi_cache(cache_path)
+            if cached is not None:
+                return cached
+        except (OSError, ValueError):
+            pass  # Missing or unreadable cache, parse from scratch
+
+    # File reads release the GIL, so parse concurrently and merge in discovery order
+    failed = False
+    with ThreadPoolExecutor(max_workers=min(32, len(abi_files))) as executor:
+        for loaded in executor.map(_load_abi_file, abi_files):
+            if loaded is None:
+                failed = True
+            else:
+                abis.update(loaded)
+
+    # Don't cache a partial result, a file that failed to parse may be readable next time
+    if cache_path is not None and not failed:
+        try:
+            _write_abi_cache(root_dir, cache_path, abis)
+        except (OSError, TypeError) as e:
+            print(f"Could not write ABI cache {cache_path}: {e}")
+
     return abis
 
+def extract_all_errors(abis) -> dict:
+    """Map every custom error's 4-byte selector to its (contract_name, error_name)"""
+    errors = {}
+    for contract_name, abi in abis.items():
+        if not isinstance(abi, list):
+            continue
+        contract_name = sys.intern(contract_name)
+
+        for item in abi:
+            if item.get('type') != 'error':
+                continue
+            name = sys.intern(item['name'])
+            signature = f"{name}({','.join(inp['type'] for inp in item.get('inputs', ()))})"
+            errors[keccak(signature.encode())[:4]] = (contract_name, name)
+    return errors
+
+@functools.lru_cache(maxsize=8)
+def _load_abis_and_errors(abis_dir, signature):
+    """Load the ABIs and errors table once per process for a given set of ABI files"""
+    abis = load_abis(abis_dir, signature)
+    return abis, extract_all_errors(abis)
+
+def load_abis_and_errors(abis_dir):
+    """
+    Load ABIs and their errors table, shared by every World built from the same unchanged directory.
+
+    The returned dicts are the cached objects themselves, not copies: treat them as read-only,
+    since a mutation is visible to every other World loaded from that directory.
+    """
+    signature = _abi_files_signature(find_abi_files(abis_dir))
+    return _load_abis_and_errors(str(Path(abis_dir).resolve()), signature)
+
+def _raise_readable_error(errors, e, func_name):
+    """Re-raise a custom error revert as "<Error> when calling <func_name>", anything else unchanged"""
+    error_str = str(e)
+    if '0x' in error_str:
+        hex_match = ERROR_HEX_RE.search(error_str)
+        selector = hex_match.group(0)[2:10] if hex_match else ''
+        if len(selector) == 8:
+            found = errors.get(bytes.fromhex(selector))
+            if found:
+                contract, error = found
+                error_msg = f"{error} when calling {func_name}"
+                new_error = type(e)((error_msg,))
+                raise new_error from None
+    raise e
+
+def _call_contract_function(world, contract_function, func_name, /, *args, **kwargs):
+    """Call a contract function for a World, translating custom error reverts into readable errors"""
+    active_batch = _ACTIVE_BATCH.get()
+    if active_batch is not None and active_batch[0] is world:
+        active_batch[1].add(contract_function(*args, **kwargs))
+        active_batch[2] += 1
+        return None
+    try:
+        return contract_function(*args, **kwargs).call()
+    except Exception as e:
+        _raise_readable_error(world.errors, e, func_name)
+
 class World:
     def __init__(self, rpc, world_address, abis_dir, indexer_url=None, mud_config_path=None):
         """
@@ -48,21 +276,34 @@ class World:
             abis_dir (str): Directory containing ABI files.
             indexer_url (str, optional): URL for the indexer. If provided, initializes the indexer.
             mud_config_path (str, optional): Path to the mud.config.ts file. Required if indexer_url is provided.
+
+        IWorld functions are exposed as attributes, except where World already defines an attribute of
+        the same name (e.g. `batch`, `indexer`); those are reachable through `world.contract.functions`.
         """
-        self.w3 = Web3(Web3.HTTPProvider(rpc))
-        self.chain_id = self.w3.eth.chain_id  # Automatically fetch the chain ID
-        self.abis = load_abis(abis_dir)
+        self._session = _rpc_session(rpc)
+        self.w3 = Web3(Web3.HTTPProvider(rpc, session=self._session))
+        # Automatically fetch the chain ID, once per RPC endpoint
+        if rpc not in _CHAIN_ID_CACHE:
+            _CHAIN_ID_CACHE[rpc] = self.w3.eth.chain_id
+        self.chain_id = _CHAIN_ID_CACHE[rpc]
+        self.abis, self.errors = load_abis_and_errors(abis_dir)
         self.indexer = None
 
         # Initialize the contract
         if "IWorld" in self.abis:
             self.contract = self.w3.eth.contract(address=world_address, abi=self.abis["IWorld"])
-            self.errors = self._extract_all_errors()
-
-            for func_name in dir(self.contract.functions):
-                if not func_name.startswith("_"):
-                    original_function = getattr(self.contract.functions, func_name)
-                    setattr(self, func_name, self._wrap_function(original_function, func_name))
+            # Contract functions are wrapped on first access in __getattr__
+            self._abi_function_names = {
+                item['name'] for item in self.abis["IWorld"] if item.get('type') == 'function'
+            }
+            # World's own attributes take precedence over contract functions of the same name
+            shadowed = self._abi_function_names & (set(dir(type(self))) | self.__dict__.keys())
+            if shadowed:
+                warnings.warn(
+                    f"IWorld functions {sorted(shadowed)} are hidden by World attributes of the same name; "
+                    "call them through world.contract.functions instead",
+                    stacklevel=2,
+                )
         else:
             raise Exception("IWorld ABI not found")
 
@@ -70,6 +311,17 @@ class World:
         if indexer_url and mud_config_path:
             self._initialize_indexer(indexer_url, world_address, mud_config_path)
 
+    def __getattr__(self, name):
+        # Only reached when normal lookup fails, i.e. a contract function that has not been wrapped yet
+        if name in self.__dict__.get('_abi_function_names', ()):
+            wrapped = self._wrap_function(getattr(self.contract.functions, name), name)
+            self.__dict__[name] = wrapped
+            return wrapped
+        raise AttributeError(f"'{type(self).__name__}' object has no attribute '{name}'")
+
+    def __dir__(self):
+        return sorted(set(super().__dir__()) | self.__dict__.get('_abi_function_names', set()))
+
     def _initialize_indexer(self, indexer_url, world_address, mud_config_path):
         """
         Initialize and set the indexer.
@@ -79,8 +331,6 @@ class World:
             world_address (str): The address of the World contract.
             mud_config_path (str): Path to the mud.config.ts file.
         """
-        from mud import MUDIndexerSDK  # Assuming MUDIndexerSDK is part of your mud package
-
         # Create the indexer
         indexer = MUDIndexerSDK(indexer_url, world_address, mud_config_path)
         self.set_indexer(indexer)
@@ -99,34 +349,41 @@ class World:
             table_instance = getattr(indexer.tables, table_name)
             setattr(self.indexer, table_name, table_instance)
 
-    def _extract_all_errors(self):
-        errors = {}
-        for contract_name, abi in self.abis.items():
-            if not isinstance(abi, list):
-                continue
+    @contextmanager
+    def batch(self):
+        """
+        Send every contract call made inside the block as a single JSON-RPC batch request.
 
-            for item in abi:
-                if item.get('type') == 'error':
-                    signature = f"{item['name']}({','.join(inp['type'] for inp in item.get('inputs', []))})"
-                    selector = self.w3.keccak(text=signature)[:4].hex()
-                    errors[selector] = (contract_name, item['name'])
-        return errors
+        Calls inside the block return None; their results are appended, in call order, to the
+        yielded list once the block exits. If no contract call was made, nothing is sent.
 
-    def _wrap_function(self, contract_function, func_name):
-        def wrapped_function(*args, **kwargs):
+        Any other request made through `world.w3` inside the block (e.g. `w3.eth.chain_id`) is
+        also deferred by web3 instead of being sent, and returns placeholder request data rather
+        than a result, so only make contract calls inside the block.
+
+        Usage:
+            with world.batch() as results:
+                for land_id in land_ids:
+                    world.calculateArea(land_id, 1)
+            print(results)
+        """
+        if _ACTIVE_BATCH.get() is not None:
+            raise RuntimeError("World.batch() blocks cannot be nested")
+
+        results = []
+        with self.w3.batch_requests() as batch:
+            active_batch = [self, batch, 0]
+            token = _ACTIVE_BATCH.set(active_batch)
             try:
-                return contract_function(*args, **kwargs).call()
+                yield results
+            finally:
+                _ACTIVE_BATCH.reset(token)
+            if not active_batch[2]:
+                return  # Nodes such as geth reject an empty batch
+            try:
+                results.extend(batch.execute())
             except Exception as e:
-                error_str = str(e)
-                if '0x' in error_str:
-                    import re
-                    hex_match = re.search(r'0x[a-fA-F0-9]+', error_str)
-                    if hex_match:
-                        selector = hex_match.group(0)[2:10]
-                        if selector in self.errors:
-                            contract, error = self.errors[selector]
-                            error_msg = f"{error} when calling {func_name}"
-                            new_error = type(e)((error_msg,))
-                            raise new_error from None
-                raise e
-        return wrapped_function
+                _raise_readable_error(self.errors, e, "batch")
+
+    def _wrap_function(self, contract_function, func_name):
+        return functools.partial(_call_contract_function, self, contract_function, func_name)
@@ -12,7 +12,7 @@ setup(
     packages=find_packages(),
     install_requires=[
         "requests>=2.25.1",
-        "web3",
+        "web3>=7",
         "python-dotenv>=0.21.0",
         "pandas",
         "IPython",
@@ -22,5 +22,5 @@ setup(
         "License :: OSI Approved :: MIT License",
         "Operating System :: OS Independent",
     ],
-    python_requires=">=3.6",
+    python_requires=">=3.8",
 )